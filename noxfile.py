@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Any
 
 import nox
@@ -97,3 +98,33 @@ def test(session: nox.Session) -> None:
     session.run(*command)
 
     session.log("✅ Testing completed successfully.")
+
+
+@nox.session(python=False)
+def bench(session: nox.Session) -> None:
+    """Run benchmarks and fail on regressions against the last saved run.
+
+    Args:
+        session (nox.Session): The Nox session object.
+
+    Examples:
+        >>> uv run nox -s bench
+
+    """
+    command = [
+        "uv",
+        "run",
+        "pytest",
+        "tests/perf",
+        "--no-cov",
+        "--benchmark-enable",
+        "--benchmark-only",
+        "--benchmark-autosave",
+    ]
+    # Comparing needs a saved run, so the first run only records a baseline
+    if any(Path(".benchmarks").glob("*/*.json")):
+        command += ["--benchmark-compare", "--benchmark-compare-fail=min:5%"]
+
+    session.run(*command)
+
+    session.log("✅ Benchmarking completed successfully.")
@@ -1,9 +1,29 @@
 import pytest
 
 from tools.config import Settings
+from tools.logger import Logger, LogType
 
 
 @pytest.fixture
 def settings() -> Settings:
     """Fixture for settings."""
     return Settings()
+
+
+@pytest.fixture(scope="session")
+def local_logger() -> Logger:
+    """Fixture for local logger."""
+    return Logger(name="test", log_type=LogType.LOCAL)
+
+
+@pytest.fixture(scope="session")
+def azure_logger() -> Logger:
+    """Fixture for Azure Monitor logger."""
+    # Use a mock connection string for testing
+    mock_connection_string = "InstrumentationKey=00000000-0000-0000-0000-000000000000;IngestionEndpoint=https://test.in.applicationinsights.azure.com/"
+
+    return Logger(
+        name="test",
+        connection_string=mock_connection_string,
+        log_type=LogType.AZURE_MONITOR,
+    )
@@ -0,0 +1,77 @@
+import logging
+from typing import TYPE_CHECKING
+
+from tools.logger import Logger, LogType
+from tools.logger.azuremonitor import AzureMonitorFormatter
+from tools.logger.local import LocalFormatter
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+_ROUNDS = 10_000
+
+
+class _DiscardHandler(logging.Handler):
+    """Handler that formats records and drops the output."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format the record without writing it."""
+        self.format(record)
+
+
+def _record() -> logging.LogRecord:
+    """Return a typical log record."""
+    return logging.makeLogRecord(
+        {
+            "name": "bench_logger",
+            "msg": "User %s performed %s",
+            "args": (12345, "login"),
+            "levelname": "INFO",
+            "levelno": logging.INFO,
+            "funcName": "bench_func",
+            "lineno": 42,
+        }
+    )
+
+
+def _setup() -> tuple[tuple[logging.LogRecord], dict[str, object]]:
+    """Return a fresh record as arguments, so only formatting is timed."""
+    return (_record(),), {}
+
+
+class TestFormatterBenchmark:
+    """Benchmarks for log formatters."""
+
+    def test_azure_monitor_format(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark AzureMonitorFormatter.format."""
+        formatter = AzureMonitorFormatter()
+
+        benchmark.pedantic(formatter.format, setup=_setup, rounds=_ROUNDS)
+
+    def test_local_format(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark LocalFormatter.format."""
+        formatter = LocalFormatter()
+
+        benchmark.pedantic(formatter.format, setup=_setup, rounds=_ROUNDS)
+
+
+class TestLoggerBenchmark:
+    """Benchmarks for Logger calls."""
+
+    def setup_method(self) -> None:
+        """Set up logger with a discarding Azure Monitor formatter."""
+        handler = _DiscardHandler()
+        handler.setFormatter(AzureMonitorFormatter())
+
+        self.logger = Logger(name="bench", log_type=LogType.LOCAL)
+        self.logger.handlers = [handler]
+
+    def test_info(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark an emitted info call."""
+        benchmark(self.logger.info, "User %s performed %s", 12345, "login")
+
+    def test_filtered_debug(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark a debug call below the logger level."""
+        self.logger.setLevel(logging.INFO)
+
+        benchmark(self.logger.debug, "User %s performed %s", 12345, "login")
@@ -1,6 +1,6 @@
 import pytest
 
-from tools.config import FastAPIKwArgs, Settings
+from tools.config import FastAPIKwArgs, Settings, get_settings
 
 
 class TestSettings:
@@ -57,6 +57,15 @@ class TestSettings:
         assert len(settings.allowed_hosts) == expected_count
         assert "localhost" in settings.allowed_hosts
 
+    def test_get_settings_cached(self) -> None:
+        """Test that get_settings returns a single cached instance."""
+        get_settings.cache_clear()
+
+        settings = get_settings()
+
+        assert settings is get_settings()
+        assert settings.IS_LOCAL
+
 
 class TestFastAPIKwArgs:
     """Test class for FastAPIKwArgs."""
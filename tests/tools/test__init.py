@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import tools
+from tools.tracer import Timer
+
+ROOT = Path(__file__).parents[2]
+
+
+def _run(code: str) -> None:
+    """Run code in a fresh interpreter so no tools module is preloaded."""
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        check=True,
+        cwd=ROOT,
+    )
+
+
+class TestLazyImport:
+    """Test class for lazy package attributes."""
+
+    def test_attribute(self) -> None:
+        """Test that public attributes resolve to the subpackage objects."""
+        assert tools.Timer is Timer
+        assert "Timer" in dir(tools)
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = tools.Unknown  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_timer_skips_pydantic(self) -> None:
+        """Test that importing Timer does not load Pydantic."""
+        _run(
+            "import sys\n"
+            "from tools import Timer\n"
+            "assert 'pydantic' not in sys.modules, 'pydantic imported'\n"
+        )
+
+    def test_subpackage_attribute(self) -> None:
+        """Test that subpackages are reachable as attributes of the package."""
+        _run(
+            "import tools\n"
+            "assert tools.config.Settings is not None\n"
+            "assert tools.logger.Logger is not None\n"
+            "assert tools.tracer.Timer is not None\n"
+        )
@@ -1,46 +1,66 @@
+import contextlib
+import datetime
+import io
 import json
 import logging
+import logging.handlers
+import threading
 
-from tools.logger import Logger, LogType
+import pytest
+
+from tools.logger import Logger, LogType, azuremonitor, disable_caller_lookup
+from tools.logger import logger as logger_module
+from tools.logger import type as logger_type
 from tools.logger.azuremonitor import AzureMonitorFormatter
 from tools.logger.local import LocalFormatter
 
 
+class _CaptureHandler(logging.Handler):
+    """Handler that keeps emitted records."""
+
+    def __init__(self) -> None:
+        """Initialize captured records."""
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.emitted = threading.Event()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Keep the record."""
+        self.records.append(record)
+        self.emitted.set()
+
+
 class TestLocalLogger:
     """Test class for local logger."""
 
-    def setup_method(self) -> None:
-        """Set up logger."""
-        self.logger = Logger(name=__name__, log_type=LogType.LOCAL)
-
-    def test_log(self) -> None:
+    def test_log(self, local_logger: Logger) -> None:
         """Test log method of logger."""
-        assert self.logger.debug("debug") is None
-        assert self.logger.info("info") is None
-        assert self.logger.warning("warning") is None
-        assert self.logger.error("error") is None
-        assert self.logger.critical("critical") is None
+        assert local_logger.debug("debug") is None
+        assert local_logger.info("info") is None
+        assert local_logger.warning("warning") is None
+        assert local_logger.error("error") is None
+        assert local_logger.critical("critical") is None
 
-    def test_name(self) -> None:
+    def test_name(self, local_logger: Logger) -> None:
         """Test correct name of logger."""
-        assert self.logger.name == __name__
+        assert local_logger.name == "test"
 
-    def test_log_output(self) -> None:
+    def test_log_output(self, local_logger: Logger) -> None:
         """Test that log methods work without errors."""
         # Logger with custom handlers doesn't work with caplog
         # Just verify methods execute without errors
-        self.logger.info("Test message")
-        self.logger.warning("Warning message")
+        local_logger.info("Test message")
+        local_logger.warning("Warning message")
 
-    def test_log_with_variables(self) -> None:
+    def test_log_with_variables(self, local_logger: Logger) -> None:
         """Test logging with variables."""
         user_id = 12345
         action = "login"
 
         # Verify logging with format strings works
-        self.logger.info("User %s performed %s", user_id, action)
+        local_logger.info("User %s performed %s", user_id, action)
 
-    def test_exception_logging(self) -> None:
+    def test_exception_logging(self, local_logger: Logger) -> None:
         """Test exception logging includes stack trace."""
 
         def _raise_exception() -> None:
@@ -50,34 +70,129 @@ class TestLocalLogger:
         try:
             _raise_exception()
         except ValueError:
-            self.logger.exception("An error occurred")
+            local_logger.exception("An error occurred")
 
+    def test_shared_handler(self, local_logger: Logger) -> None:
+        """Test that loggers share the same stdout handler."""
+        other = Logger(name="other", log_type=LogType.LOCAL)
 
-class TestAzureMonitorLogger:
-    """Test class for Azure Monitor logger."""
+        assert other.handlers == local_logger.handlers
+        assert other.handlers[0] is local_logger.handlers[0]
 
-    def setup_method(self) -> None:
-        """Set up logger."""
-        # Use a mock connection string for testing
-        mock_connection_string = "InstrumentationKey=00000000-0000-0000-0000-000000000000;IngestionEndpoint=https://test.in.applicationinsights.azure.com/"
+    def test_redirected_stdout(self) -> None:
+        """Test that output follows stdout replaced after import."""
+        logger = Logger(name="redirect", log_type=LogType.LOCAL)
+        buffer = io.StringIO()
 
-        self.logger = Logger(
-            name=__name__,
-            connection_string=mock_connection_string,
-            log_type=LogType.AZURE_MONITOR,
-        )
+        with contextlib.redirect_stdout(buffer):
+            logger.warning("hello")
+
+        assert "hello" in buffer.getvalue()
+
+    def test_level_filter(self) -> None:
+        """Test that setLevel refreshes the cached level check."""
+        logger = Logger(name="level", log_type=LogType.LOCAL)
+
+        assert logger.debug_enabled
+        assert logger.isEnabledFor(logging.DEBUG)
+
+        logger.setLevel(logging.WARNING)
+
+        assert not logger.debug_enabled
+        assert not logger.isEnabledFor(logging.INFO)
+        assert logger.isEnabledFor(logging.ERROR)
+
+    def test_level_filter_follows_parent_and_disable(self) -> None:
+        """Test that level checks follow the parent level and logging.disable."""
+        logger = Logger(name="child", log_type=LogType.LOCAL)
+        parent = logging.getLogger("test_parent")
+        parent.setLevel(logging.DEBUG)
+        logger.parent = parent
+
+        assert logger.debug_enabled
+
+        parent.setLevel(logging.WARNING)
+
+        assert not logger.debug_enabled
+        assert not logger.isEnabledFor(logging.INFO)
+
+        logger.setLevel(logging.DEBUG)
 
-    def test_log(self) -> None:
+        assert logger.debug_enabled
+
+        try:
+            logging.disable(logging.CRITICAL)
+
+            assert not logger.debug_enabled
+        finally:
+            logging.disable(logging.NOTSET)
+
+        assert logger.debug_enabled
+
+        logger.disabled = True
+
+        assert not logger.debug_enabled
+
+    def test_async_logging(self) -> None:
+        """Test that async logging delivers records through a shared queue."""
+        logger = Logger(name="async", log_type=LogType.LOCAL, async_logging=True)
+        other = Logger(name="other", log_type=LogType.LOCAL, async_logging=True)
+
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+        assert logger.handlers[0] is other.handlers[0]
+
+        handler = _CaptureHandler()
+        logger.handlers = [logger_module._queue_handler(handler)]  # noqa: SLF001
+        logger.info("User %s performed %s", 12345, "login")
+
+        assert handler.emitted.wait(timeout=5)
+        assert handler.records[0].getMessage() == "User 12345 performed login"
+
+    def test_disable_caller_lookup(self) -> None:
+        """Test that caller lookup can be disabled."""
+        handler = _CaptureHandler()
+        logger = Logger(name="caller", log_type=LogType.LOCAL)
+        logger.handlers = [handler]
+        srcfile = logging._srcfile  # noqa: SLF001
+
+        try:
+            logger.info("before")
+            disable_caller_lookup()
+            logger.info("after")
+        finally:
+            logging._srcfile = srcfile  # noqa: SLF001
+
+        before, after = handler.records
+
+        assert before.funcName == "test_disable_caller_lookup"
+        assert before.lineno > 0
+        assert after.funcName == "(unknown function)"
+        assert after.lineno == 0
+
+
+class TestAzureMonitorLogger:
+    """Test class for Azure Monitor logger."""
+
+    def test_log(self, azure_logger: Logger) -> None:
         """Test log method of logger."""
-        assert self.logger.debug("debug") is None
-        assert self.logger.info("info") is None
-        assert self.logger.warning("warning") is None
-        assert self.logger.error("error") is None
-        assert self.logger.critical("critical") is None
+        assert azure_logger.debug("debug") is None
+        assert azure_logger.info("info") is None
+        assert azure_logger.warning("warning") is None
+        assert azure_logger.error("error") is None
+        assert azure_logger.critical("critical") is None
 
-    def test_name(self) -> None:
+    def test_name(self, azure_logger: Logger) -> None:
         """Test correct name of logger."""
-        assert self.logger.name == __name__
+        assert azure_logger.name == "test"
+
+
+class TestLogType:
+    """Test class for LogType."""
+
+    def test_single_definition(self) -> None:
+        """Test that LogType is the same class from every import path."""
+        assert LogType is logger_type.LogType
+        assert LogType.LOCAL is logger_type.LogType.LOCAL
 
 
 class TestLocalFormatter:
@@ -148,3 +263,79 @@ class TestAzureMonitorFormatter:
 
         assert data["level"] == "ERROR"
         assert data["message"] == "Error occurred"
+
+    def test_format_timestamp(self) -> None:
+        """Test that timestamp matches datetime ISO-8601 format."""
+        formatter = AzureMonitorFormatter()
+
+        for created in (1_700_000_000.0, 1_700_000_000.25, 1_700_000_000.9999996):
+            record = logging.makeLogRecord({"msg": "Test message"})
+            record.created = created
+
+            data = json.loads(formatter.format(record))
+
+            assert (
+                data["timestamp"]
+                == datetime.datetime.fromtimestamp(created, tz=datetime.UTC).isoformat()
+            )
+
+    def test_format_without_caller(self) -> None:
+        """Test that func and line are omitted without caller information."""
+        formatter = AzureMonitorFormatter()
+        record = logging.makeLogRecord(
+            {
+                "name": "test_logger",
+                "msg": "Test message",
+                "levelname": "INFO",
+                "funcName": "(unknown function)",
+                "lineno": 0,
+            }
+        )
+
+        data = json.loads(formatter.format(record))
+
+        assert data["message"] == "Test message"
+        assert "func" not in data
+        assert "line" not in data
+
+    def test_format_after_redaction(self) -> None:
+        """Test that changes to msg and args after another handler are used."""
+        formatter = AzureMonitorFormatter()
+        record = logging.makeLogRecord({"msg": "password=%s", "args": ("secret",)})
+
+        LocalFormatter().format(record)
+        record.msg = "password=%s"
+        record.args = ("***",)
+
+        data = json.loads(formatter.format(record))
+
+        assert data["message"] == "password=***"
+
+    @pytest.mark.parametrize(
+        ("msg", "lineno"),
+        [
+            ("Grüße, 世界 \u2028 🚀", 42),
+            ('Tab\tnewline\n\x00\x1f\x7f "quoted" \\', 42),
+            ("No caller", 0),
+        ],
+    )
+    def test_format_orjson_matches_json(
+        self, monkeypatch: pytest.MonkeyPatch, msg: str, lineno: int
+    ) -> None:
+        """Test that the orjson and json encoders produce the same output."""
+        pytest.importorskip("orjson")
+        formatter = AzureMonitorFormatter()
+        record = logging.makeLogRecord(
+            {
+                "name": "test_logger",
+                "msg": msg,
+                "levelname": "INFO",
+                "funcName": "test_func",
+                "lineno": lineno,
+            }
+        )
+
+        fast = formatter.format(record)
+        monkeypatch.setattr(azuremonitor, "orjson", None)
+
+        assert formatter.format(record) == fast
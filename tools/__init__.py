@@ -16,11 +16,18 @@ Examples:
     >>> def my_function():
     >>>     logger.info("Function executed")
 
+Subpackages are imported on first attribute access, so importing `Timer` does not
+load Pydantic or Azure Monitor.
+
 """
 
-from tools.config import FastAPIKwArgs, Settings
-from tools.logger import Logger, LogType
-from tools.tracer import Timer
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tools.config import FastAPIKwArgs, Settings
+    from tools.logger import Logger, LogType
+    from tools.tracer import Timer
 
 __all__ = [
     "FastAPIKwArgs",
@@ -29,3 +36,43 @@ __all__ = [
     "Settings",
     "Timer",
 ]
+
+_MODULES = {
+    "FastAPIKwArgs": "tools.config",
+    "LogType": "tools.logger",
+    "Logger": "tools.logger",
+    "Settings": "tools.config",
+    "Timer": "tools.tracer",
+}
+_SUBPACKAGES = {"config", "logger", "tracer"}
+
+
+def __getattr__(name: str) -> object:
+    """Import public attributes lazily (PEP 562).
+
+    Args:
+        name (str): Attribute name
+
+    Returns:
+        object: Attribute exported by the owning subpackage, or the subpackage
+
+    Raises:
+        AttributeError: If the attribute is not exported by this package
+
+    """
+    if name in _SUBPACKAGES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name in _MODULES:
+        value = getattr(importlib.import_module(_MODULES[name]), name)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return module attributes including lazily imported ones."""
+    return sorted({*globals(), *__all__})
@@ -1,9 +1,10 @@
 """Settings."""
 
 from tools.config.fastapi import FastAPIKwArgs
-from tools.config.settings import Settings
+from tools.config.settings import Settings, get_settings
 
 __all__ = [
     "FastAPIKwArgs",
     "Settings",
+    "get_settings",
 ]
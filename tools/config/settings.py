@@ -1,3 +1,4 @@
+import functools
 from typing import Any
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -53,3 +54,22 @@ class Settings(BaseSettings):
             redoc_url=self.redoc_url,
             openapi_prefix=self.openapi_prefix,
         ).model_dump()
+
+
+@functools.cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, loaded once on first call.
+
+    Use `Settings(...)` directly when custom values are needed.
+
+    Returns:
+        Settings: Cached settings
+
+    Examples:
+        >>> from tools.config import get_settings
+        >>>
+        >>>
+        >>> settings = get_settings()
+
+    """
+    return Settings()
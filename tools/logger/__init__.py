@@ -2,7 +2,7 @@
 
 from tools.logger.azuremonitor import AzureMonitorFormatter
 from tools.logger.local import LocalFormatter
-from tools.logger.logger import Logger
+from tools.logger.logger import Logger, disable_caller_lookup
 from tools.logger.type import LogType
 
 __all__ = [
@@ -10,4 +10,5 @@ __all__ = [
     "LocalFormatter",
     "LogType",
     "Logger",
+    "disable_caller_lookup",
 ]
@@ -1,5 +1,57 @@
+import datetime
+import functools
+import json
 import logging
 
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:
+    orjson = None
+
+_MICROSECONDS_PER_SECOND = 1_000_000
+
+# json.dumps builds a new encoder whenever options are passed, so reuse one
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=1)
+def _fmt_second(second: int) -> str:
+    """Format a whole second as an ISO-8601 UTC date and time.
+
+    Adjacent records almost always share the same second, so only the most
+    recent value is cached.
+
+    Args:
+        second (int): Seconds since the epoch
+
+    Returns:
+        str: ISO-8601 timestamp without fraction and offset
+
+    """
+    return datetime.datetime.fromtimestamp(second, tz=datetime.UTC).strftime(
+        "%Y-%m-%dT%H:%M:%S"
+    )
+
+
+def _fmt_ts(created: float) -> str:
+    """Format a record creation time as an ISO-8601 UTC timestamp.
+
+    Args:
+        created (float): `LogRecord.created` in seconds since the epoch
+
+    Returns:
+        str: ISO-8601 timestamp, same as `datetime.isoformat()`
+
+    """
+    second = int(created)
+    microsecond = round((created - second) * _MICROSECONDS_PER_SECOND)
+    if microsecond >= _MICROSECONDS_PER_SECOND:
+        second += 1
+        microsecond -= _MICROSECONDS_PER_SECOND
+    if microsecond:
+        return f"{_fmt_second(second)}.{microsecond:06d}+00:00"
+    return f"{_fmt_second(second)}+00:00"
+
 
 class AzureMonitorFormatter(logging.Formatter):
     """Formatter for Azure Monitor logger."""
@@ -14,27 +66,22 @@ class AzureMonitorFormatter(logging.Formatter):
             str: Log format for Azure Monitor
 
         """
-        from pydantic import BaseModel, PositiveInt
-
-        class Record(BaseModel):
-            """Record for Azure Monitor."""
-
-            name: str
-            line: PositiveInt
-            func: str
-            message: str
-            level: str
-            timestamp: str
-
-        import datetime
-
-        return Record(
-            name=record.name,
-            line=record.lineno,
-            func=record.funcName,
-            message=record.getMessage(),
-            level=record.levelname,
-            timestamp=datetime.datetime.fromtimestamp(
-                record.created, tz=datetime.UTC
-            ).isoformat(),
-        ).model_dump_json()
+        # Recompute like Formatter does, as filters may have changed msg or args
+        record.message = record.getMessage()
+
+        data = {
+            "name": record.name,
+            "line": record.lineno,
+            "func": record.funcName,
+            "message": record.message,
+            "level": record.levelname,
+            "timestamp": _fmt_ts(record.created),
+        }
+        if not record.lineno:
+            # Caller lookup is disabled, so func and line carry no information
+            del data["line"], data["func"]
+
+        if orjson is not None:
+            return orjson.dumps(data).decode()
+
+        return _ENCODER.encode(data)
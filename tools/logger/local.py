@@ -30,6 +30,10 @@ class LocalFormatter(logging.Formatter):
             logging.ERROR: base.format(color=LogColor.RED + LogStyle.BOLD),
             logging.CRITICAL: base.format(color=LogColor.BLOOD + LogStyle.BOLD),
         }
+        self._formatters = {
+            level: logging.Formatter(fmt) for level, fmt in self.formats.items()
+        }
+        self._default_formatter = logging.Formatter()
 
     def format(self, record: logging.LogRecord) -> str:
         """Style for local logger.
@@ -41,7 +45,6 @@ class LocalFormatter(logging.Formatter):
             str: Log format for local
 
         """
-        fmt = self.formats.get(record.levelno)
-        formatter = logging.Formatter(fmt)
+        formatter = self._formatters.get(record.levelno, self._default_formatter)
 
         return formatter.format(record)
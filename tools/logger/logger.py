@@ -1,13 +1,86 @@
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO, override
 
+from tools.logger.azuremonitor import AzureMonitorFormatter
+from tools.logger.local import LocalFormatter
 from tools.logger.type import LogType
 
 if TYPE_CHECKING:
     from azure.identity import DefaultAzureCredential
 
 
+class _StdoutHandler(logging.StreamHandler[TextIO]):
+    """Stream handler that writes to the current `sys.stdout`.
+
+    The stream is looked up on every write, so redirected or captured stdout
+    (e.g. `contextlib.redirect_stdout`) is respected, like `logging.lastResort`.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize handler without binding a stream."""
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self) -> TextIO:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return the current `sys.stdout`."""
+        return sys.stdout
+
+
+# Formatters are stateless, so every Logger shares the same stdout handlers
+_LOCAL_HANDLER = _StdoutHandler()
+_LOCAL_HANDLER.setFormatter(LocalFormatter())
+
+_AZURE_HANDLER = _StdoutHandler()
+_AZURE_HANDLER.setFormatter(AzureMonitorFormatter())
+
+
+@functools.cache
+def _queue_handler(handler: logging.Handler) -> logging.handlers.QueueHandler:
+    """Return a queue handler that feeds `handler` from a background thread.
+
+    The listener thread is started on first use and stopped at exit.
+
+    Args:
+        handler (logging.Handler): Handler that formats and writes the records
+
+    Returns:
+        logging.handlers.QueueHandler: Handler to attach to loggers
+
+    """
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        records, handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    return logging.handlers.QueueHandler(records)
+
+
+def disable_caller_lookup() -> None:
+    """Disable the caller frame lookup done for every log record.
+
+    Logging skips `sys._getframe` when emitting records, which is the most
+    expensive part of a log call. Records then carry `(unknown function)` as
+    `funcName` and `0` as `lineno`, and `AzureMonitorFormatter` omits the
+    `func` and `line` fields.
+
+    Examples:
+        >>> from tools.logger import disable_caller_lookup
+        >>>
+        >>>
+        >>> disable_caller_lookup()
+
+    """
+    logging._srcfile = None  # noqa: SLF001
+
+
 class Logger(logging.Logger):
     """Logger.
 
@@ -17,6 +90,9 @@ class Logger(logging.Logger):
         >>>
         >>> logger = Logger(__name__)
         >>> logger.info("Logger")
+        >>>
+        >>> if logger.debug_enabled:
+        >>>     logger.debug("Details: %s", expensive())
 
     """
 
@@ -26,6 +102,8 @@ class Logger(logging.Logger):
         connection_string: str | None = None,
         credential: DefaultAzureCredential | None = None,
         log_type: LogType = LogType.LOCAL,
+        *,
+        async_logging: bool = False,
     ) -> None:
         """Initialize local logger formatter.
 
@@ -37,11 +115,14 @@ class Logger(logging.Logger):
                                                                   Defaults to None.
             log_type (LogType, optional): Local or Azure Monitor.
                                           Defaults to LogType.LOCAL.
+            async_logging (bool, optional): Format and write records on a background
+                                            thread instead of the calling thread.
+                                            Defaults to False.
 
         """
         super().__init__(name=name)
 
-        if log_type == LogType.AZURE_MONITOR:
+        if log_type is LogType.AZURE_MONITOR:
             if not connection_string and not credential:
                 msg = (
                     "Azure Monitor logging requires either "
@@ -49,9 +130,15 @@ class Logger(logging.Logger):
                 )
                 raise ValueError(msg)
 
-            from azure.monitor.opentelemetry import configure_azure_monitor
-
-            from tools.logger import AzureMonitorFormatter
+            # Imported here so local-only users do not load OpenTelemetry
+            try:
+                from azure.monitor.opentelemetry import configure_azure_monitor
+            except ImportError as e:
+                msg = (
+                    "Azure Monitor logging requires "
+                    "the azure-monitor-opentelemetry package"
+                )
+                raise ImportError(msg) from e
 
             # Configure Azure Monitor with OpenTelemetry
             configure_azure_monitor(
@@ -59,17 +146,33 @@ class Logger(logging.Logger):
                 credential=credential,
             )
 
-            formatter = AzureMonitorFormatter()
-            handler = logging.StreamHandler(stream=sys.stdout)
+        handler = (
+            _AZURE_HANDLER if log_type is LogType.AZURE_MONITOR else _LOCAL_HANDLER
+        )
+        self.addHandler(_queue_handler(handler) if async_logging else handler)
+
+    @override
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether records of the given level would be processed.
 
-            handler.setFormatter(formatter)
-            self.addHandler(handler)
-            return
+        `logging.Logger.isEnabledFor` caches its result per level and relies on
+        `logging.getLogger` registration to clear it. Loggers created directly
+        are not registered, so `logging.disable` and parent level changes would
+        leave stale results. The check is done without the cache instead.
 
-        from tools.logger import LocalFormatter
+        Args:
+            level (int): Logging level
+
+        Returns:
+            bool: True if the level is enabled
+
+        """
+        if self.disabled or self.manager.disable >= level:
+            return False
 
-        formatter = LocalFormatter()
-        handler = logging.StreamHandler(stream=sys.stdout)
+        return level >= self.getEffectiveLevel()
 
-        handler.setFormatter(formatter)
-        self.addHandler(handler)
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether debug records would be processed."""
+        return self.isEnabledFor(logging.DEBUG)
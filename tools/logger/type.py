@@ -1,7 +1,7 @@
-from enum import StrEnum, auto
+from enum import Enum, auto
 
 
-class LogType(StrEnum):
+class LogType(Enum):
     """Logger type.
 
     Attributes:
@@ -1,5 +1,20 @@
+import functools
+import threading
 import time
 from contextlib import ContextDecorator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tools.logger import Logger
+
+
+class _Measurements(threading.local):
+    """Per-thread start times and last duration of a Timer."""
+
+    def __init__(self) -> None:
+        """Initialize measurements for the current thread."""
+        self.starts: list[int] = []
+        self.duration_ns = 0
 
 
 class Timer(ContextDecorator):
@@ -36,26 +51,32 @@ class Timer(ContextDecorator):
         """
         super().__init__()
         self.name = name
+        self._measurements = _Measurements()
 
     def __enter__(self) -> None:
         """Run when enter ContextManager or Decorator."""
-        self.start = time.time()
+        self._measurements.starts.append(time.perf_counter_ns())
 
     def __exit__(self, *exc: object) -> None:
         """Run when exit ContextManager or Decoraotr."""
-        self.end = time.time()
+        measurements = self._measurements
+        measurements.duration_ns = time.perf_counter_ns() - measurements.starts.pop()
+
+        self._logger.debug("executed in %f ms", measurements.duration_ns / 1_000_000)
 
-        from tools.config import Settings
+    @functools.cached_property
+    def _logger(self) -> Logger:
+        """Logger shared by every run of this Timer."""
+        from tools.config import get_settings
         from tools.logger import Logger, LogType
 
-        settings = Settings()
-        logger = Logger(
+        settings = get_settings()
+        return Logger(
             self.name,
             log_type=LogType.LOCAL if settings.IS_LOCAL else LogType.AZURE_MONITOR,
         )
-        logger.debug("executed in %f ms", self._duration * 1_000)
 
     @property
     def _duration(self) -> float:
-        """Return duration in seconds."""
-        return self.end - self.start
+        """Return duration in seconds of the last run in this thread."""
+        return self._measurements.duration_ns / 1_000_000_000